@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryNotReady,
@@ -12,10 +13,14 @@ from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
 
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN, PLATFORMS
+from .const import BACKFILL_INTERVAL, DATA_SNAPSHOT_VIEW, DOMAIN, PLATFORMS
 from .api import PonBikeApi, PonBikeApiError
+from .backfill import PonBikeBackfill, backfill_store
+from .capabilities import PonBikeCapabilities, capabilities_store
 from .coordinator import PonBikeCoordinator
+from .snapshot import PonBikeSnapshotView
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,7 +74,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady from err
 
     # Coordinator (new minimal wiring)
-    coordinator = PonBikeCoordinator(hass, api)
+    capabilities = PonBikeCapabilities(hass, entry.entry_id)
+    await capabilities.async_load()
+    coordinator = PonBikeCoordinator(hass, api, capabilities)
     await coordinator.async_config_entry_first_refresh()
     dev_reg = dr.async_get(hass)
     for bike in coordinator.data.get("bikes", []):
@@ -95,7 +102,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "coordinator": coordinator,
     }
 
+    # HTTP views cannot be unregistered, so register once per HA run
+    if not hass.data.get(DATA_SNAPSHOT_VIEW):
+        hass.http.register_view(PonBikeSnapshotView(hass))
+        hass.data[DATA_SNAPSHOT_VIEW] = True
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Fill gaps between polls (and outages) from the historical endpoints;
+    # checkpointed, so each run only fetches what is new
+    if "recorder" in hass.config.components:
+        backfill = PonBikeBackfill(hass, api, capabilities, entry.entry_id)
+
+        @callback
+        def _async_start_backfill(_now: datetime | None = None) -> None:
+            bikes = [bike for bike in (coordinator.data or {}).get("bikes", []) if bike.get("bikeId")]
+            entry.async_create_background_task(
+                hass, backfill.async_run(bikes), f"{DOMAIN}_backfill_{entry.entry_id}"
+            )
+
+        _async_start_backfill()
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass, _async_start_backfill, timedelta(seconds=BACKFILL_INTERVAL)
+            )
+        )
+
     return True
 
 
@@ -106,3 +138,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     return unload_ok
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove per-entry storage when the integration is deleted."""
+    await backfill_store(hass, entry.entry_id).async_remove()
+    await capabilities_store(hass, entry.entry_id).async_remove()
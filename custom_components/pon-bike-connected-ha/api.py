@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+if TYPE_CHECKING:
+    from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -11,6 +13,8 @@ _LOGGER = logging.getLogger(__name__)
 # https://data-act.connected.pon.bike/api/v1/...
 BASE_URL = "https://data-act.connected.pon.bike/api"
 
+HISTORY_PAGE_SIZE = 100
+
 
 class PonBikeApiError(Exception):
     """Raised when the PON API call fails."""
@@ -19,12 +23,14 @@ class PonBikeApiError(Exception):
 class PonBikeApi:
     """API wrapper for PON Connected Bikes."""
 
-    def __init__(self, oauth_session: OAuth2Session) -> None:
+    def __init__(self, oauth_session: OAuth2Session, base_url: str = BASE_URL) -> None:
         self._oauth = oauth_session
+        # Overridable so the API can be pointed at a local stand-in
+        self._base_url = base_url
 
     async def _request(self, method: str, path: str, **kwargs) -> Any:
         """Perform an authenticated request via OAuth2Session."""
-        url = f"{BASE_URL}{path}"
+        url = f"{self._base_url}{path}"
 
         # Match Swagger behaviour
         headers = kwargs.pop("headers", {})
@@ -68,4 +74,54 @@ class PonBikeApi:
         """Return last known states per bike (GPS + telemetry)."""
         return await self._request("GET", "/v1/bikes/last-known-states")
 
-
+    async def _async_get_history_page(
+        self,
+        path: str,
+        cursor: str | None = None,
+        since: str | None = None,
+        page_size: int = HISTORY_PAGE_SIZE,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Return one page of a historical endpoint as (items, next_cursor).
+
+        Contract: {"items": [...], "nextCursor": str | null}, items oldest first.
+        """
+        params: dict[str, Any] = {"pageSize": page_size, "order": "asc"}
+        if cursor:
+            params["cursor"] = cursor
+        elif since:
+            params["from"] = since
+
+        page = await self._request("GET", path, params=params)
+
+        if not isinstance(page, dict) or not isinstance(page.get("items"), list):
+            raise PonBikeApiError(f"Unexpected paged response calling {path}: {str(page)[:200]}")
+        next_cursor = page.get("nextCursor")
+        if next_cursor is not None and not isinstance(next_cursor, str):
+            raise PonBikeApiError(f"Unexpected nextCursor calling {path}: {next_cursor!r}")
+        return page["items"], next_cursor
+
+    async def _async_iter_history(
+        self,
+        path: str,
+        cursor: str | None = None,
+        since: str | None = None,
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], str | None]]:
+        """Yield (items, next_cursor) pages until the endpoint is exhausted."""
+        while True:
+            items, next_cursor = await self._async_get_history_page(path, cursor, since)
+            yield items, next_cursor
+            if not next_cursor or next_cursor == cursor:
+                return
+            cursor = next_cursor
+
+    def async_iter_rides(
+        self, bike_id: str, cursor: str | None = None, since: str | None = None
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], str | None]]:
+        """Iterate historical rides of a bike, oldest first, page by page."""
+        return self._async_iter_history(f"/v1/bikes/{bike_id}/rides", cursor, since)
+
+    def async_iter_telemetry(
+        self, bike_id: str, cursor: str | None = None, since: str | None = None
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], str | None]]:
+        """Iterate historical states (GPS + telemetry) of a bike, oldest first."""
+        return self._async_iter_history(f"/v1/bikes/{bike_id}/states", cursor, since)
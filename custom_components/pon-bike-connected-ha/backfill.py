@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticMeanType
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .api import PonBikeApi, PonBikeApiError
+from .capabilities import PonBikeCapabilities
+from .const import BACKFILL_MAX_CONCURRENCY, BACKFILL_STORAGE_VERSION, DOMAIN
+from .helpers import bike_name
+from .history import STATISTICS, accumulate, new_checkpoint, ride_entry, state_entry
+
+_LOGGER = logging.getLogger(__name__)
+
+_KINDS = {"rides": ride_entry, "telemetry": state_entry}
+
+
+def backfill_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, BACKFILL_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.backfill")
+
+
+class PonBikeBackfill:
+    """Backfill historical rides and states into long-term statistics.
+
+    Each (bike, kind) job walks its endpoint page by page. After each page the
+    hourly rows are written and the checkpoint (cursor, last item, open hourly
+    buckets) is stored, so an interrupted run resumes where it stopped without
+    counting anything twice. Re-running picks up whatever is new since.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: PonBikeApi,
+        capabilities: PonBikeCapabilities,
+        entry_id: str,
+        max_concurrency: int = BACKFILL_MAX_CONCURRENCY,
+    ) -> None:
+        self.hass = hass
+        self.api = api
+        self.capabilities = capabilities
+        self._store = backfill_store(hass, entry_id)
+        self._checkpoints: dict[str, Any] = {}
+        self._loaded = False
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+
+    async def async_run(self, bikes: list[dict[str, Any]]) -> None:
+        """Backfill all bikes, at most max_concurrency jobs at a time.
+
+        A run that starts while another is still going is skipped.
+        """
+        if self._lock.locked():
+            _LOGGER.debug("PON backfill still running, skipping this run")
+            return
+        async with self._lock:
+            if not self._loaded:
+                self._checkpoints = await self._store.async_load() or {}
+                self._loaded = True
+            await asyncio.gather(
+                *(self._async_backfill(bike, kind) for bike in bikes for kind in _KINDS)
+            )
+            await self._store.async_save(self._checkpoints)
+
+    def _keys(self, bike: dict[str, Any], kind: str) -> list[str]:
+        """Statistic keys worth importing for this bike."""
+        if kind == "rides":
+            return ["ride_distance"]
+        # Skip telemetry fields this bike / drive unit does not (meaningfully) report
+        return [key for key in ("odometer", "module_charge") if self.capabilities.useful(bike, key)]
+
+    def _iter_pages(
+        self, bike_id: str, kind: str, checkpoint: dict[str, Any]
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], str | None]]:
+        iterate = self.api.async_iter_rides if kind == "rides" else self.api.async_iter_telemetry
+        return iterate(bike_id, cursor=checkpoint["cursor"], since=checkpoint["last_ts"])
+
+    async def _async_backfill(self, bike: dict[str, Any], kind: str) -> None:
+        bike_id = str(bike.get("bikeId") or "")
+        keys = self._keys(bike, kind)
+        if not bike_id or not keys:
+            return
+        checkpoint: dict[str, Any] = self._checkpoints.setdefault(bike_id, {}).setdefault(
+            kind, new_checkpoint()
+        )
+
+        async with self._semaphore:
+            try:
+                try:
+                    pages = await self._async_walk(bike, kind, keys, checkpoint)
+                except PonBikeApiError as err:
+                    if not checkpoint["cursor"]:
+                        raise
+                    # Stored cursor may have expired; resume from the last item instead
+                    _LOGGER.debug(
+                        "PON %s cursor for %s rejected (%s), retrying from last item", kind, bike_id, err
+                    )
+                    checkpoint["cursor"] = None
+                    pages = await self._async_walk(bike, kind, keys, checkpoint)
+            except PonBikeApiError as err:
+                _LOGGER.warning("PON %s backfill for %s stopped: %s", kind, bike_id, err)
+                return
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Unexpected error during PON %s backfill for %s", kind, bike_id)
+                return
+
+        _LOGGER.debug("PON %s backfill for %s done (%s pages)", kind, bike_id, pages)
+
+    async def _async_walk(
+        self, bike: dict[str, Any], kind: str, keys: list[str], checkpoint: dict[str, Any]
+    ) -> int:
+        pages = 0
+        async for items, next_cursor in self._iter_pages(str(bike["bikeId"]), kind, checkpoint):
+            rows = accumulate(checkpoint, items, _KINDS[kind], keys)
+            for key, key_rows in rows.items():
+                self._add_statistics(bike, key, key_rows)
+            checkpoint["cursor"] = next_cursor
+            self._store.async_delay_save(lambda: self._checkpoints, 10)
+            pages += 1
+        return pages
+
+    def _add_statistics(self, bike: dict[str, Any], key: str, rows: list[dict[str, Any]]) -> None:
+        name, unit, unit_class, has_sum = STATISTICS[key]
+        metadata = {
+            "mean_type": StatisticMeanType.NONE if has_sum else StatisticMeanType.ARITHMETIC,
+            "has_sum": has_sum,
+            "name": f"{bike_name(bike)} {name}",
+            "source": DOMAIN,
+            "statistic_id": f"{DOMAIN}:{slugify(str(bike.get('bikeId')))}_{key}",
+            "unit_class": unit_class,
+            "unit_of_measurement": unit,
+        }
+        async_add_external_statistics(self.hass, metadata, rows)
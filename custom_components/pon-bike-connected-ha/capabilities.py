@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CAPABILITIES_CONSTANT_AFTER,
+    CAPABILITIES_MIN_SAMPLES,
+    CAPABILITIES_STORAGE_VERSION,
+    DOMAIN,
+)
+
+# Telemetry fields that back optional entities / attributes
+FIELDS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "odometer": lambda s: (s.get("bikeTelemetry") or {}).get("odometer"),
+    "module_charge": lambda s: (s.get("iotTelemetry") or {}).get("moduleCharge"),
+}
+
+# Fields where "never changed" means "useless"; an odometer legitimately stands still for weeks
+CONSTANT_FIELDS: set[str] = {"module_charge"}
+
+
+def capabilities_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, CAPABILITIES_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities")
+
+
+class PonBikeCapabilities:
+    """Learn which telemetry fields a bike (or its drive unit type) provides.
+
+    Observations are kept per bike and per driveUnitType and persisted, so a
+    new bike on a known drive unit benefits from what other bikes taught us.
+    A field is "absent" once it was never reported in enough samples, and
+    (for CONSTANT_FIELDS only) "constant" once it never changed over a long
+    enough period (e.g. the always-100% charge of Bosch BES3 bikes).
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = capabilities_store(hass, entry_id)
+        self._data: dict[str, Any] = {"bike": {}, "unit": {}, "disabled": []}
+
+    async def async_load(self) -> None:
+        """Load observations from a previous run."""
+        stored = await self._store.async_load()
+        if stored:
+            self._data = {
+                "bike": stored.get("bike", {}),
+                "unit": stored.get("unit", {}),
+                "disabled": stored.get("disabled", []),
+            }
+
+    def _scopes(self, bike: dict[str, Any], create: bool = False) -> list[dict[str, Any]]:
+        """Return the bike scope and, if known, its drive unit scope."""
+        keys: list[tuple[str, str]] = []
+        if bike_id := bike.get("bikeId"):
+            keys.append(("bike", str(bike_id)))
+        if unit := bike.get("driveUnitType"):
+            keys.append(("unit", str(unit)))
+
+        scopes: list[dict[str, Any]] = []
+        for kind, key in keys:
+            if create:
+                scopes.append(self._data[kind].setdefault(key, {}))
+            elif key in self._data[kind]:
+                scopes.append(self._data[kind][key])
+        return scopes
+
+    def observe(self, bike: dict[str, Any], state: dict[str, Any]) -> None:
+        """Record one state sample for a bike.
+
+        The store is only rewritten when a verdict can change, not on every poll.
+        """
+        changed = False
+        for field, extract in FIELDS.items():
+            value = extract(state)
+            for scope in self._scopes(bike, create=True):
+                obs = scope.get(field)
+                if obs is None:
+                    obs = scope[field] = {
+                        "samples": 0,
+                        "present": 0,
+                        "first": None,
+                        "since": None,
+                        "varies": False,
+                    }
+                    changed = True
+                # Counting stops once mature; only the verdict-relevant bits still change
+                if obs["samples"] < CAPABILITIES_MIN_SAMPLES:
+                    obs["samples"] += 1
+                    changed = True
+                if value is None:
+                    continue
+                if obs["present"] == 0:
+                    obs["present"] = 1
+                    changed = True
+                if obs["first"] is None:
+                    # Constancy is measured from the first actual value
+                    obs["first"] = value
+                    obs["since"] = dt_util.utcnow().isoformat()
+                    changed = True
+                elif not obs["varies"] and value != obs["first"]:
+                    obs["varies"] = True
+                    changed = True
+        if changed:
+            self._store.async_delay_save(lambda: self._data, 60)
+
+    def _observation(self, bike: dict[str, Any], field: str) -> dict[str, Any] | None:
+        """Return the bike's own observation, else its drive unit's, once mature."""
+        for scope in self._scopes(bike):
+            obs = scope.get(field)
+            if obs and obs["samples"] >= CAPABILITIES_MIN_SAMPLES:
+                return obs
+        return None
+
+    def provides(self, bike: dict[str, Any], field: str) -> bool:
+        """Return False only when the field is known to be absent."""
+        obs = self._observation(bike, field)
+        return obs is None or obs["present"] > 0
+
+    def is_constant(self, bike: dict[str, Any], field: str) -> bool:
+        """Return True when the field never changed over a long period."""
+        if field not in CONSTANT_FIELDS:
+            return False
+        obs = self._observation(bike, field)
+        if obs is None or obs["present"] == 0 or obs["varies"]:
+            return False
+        since = dt_util.parse_datetime(obs["since"]) if obs["since"] else None
+        return since is not None and dt_util.utcnow() - since >= timedelta(
+            days=CAPABILITIES_CONSTANT_AFTER
+        )
+
+    def useful(self, bike: dict[str, Any], field: str) -> bool:
+        """Return True when the field is worth extracting on every update."""
+        return self.provides(bike, field) and not self.is_constant(bike, field)
+
+    def was_disabled(self, unique_id: str) -> bool:
+        """Return True when we disabled this entity before (and the user may have re-enabled it)."""
+        return unique_id in self._data["disabled"]
+
+    def set_disabled(self, unique_id: str, disabled: bool) -> None:
+        """Remember whether we disabled an entity, so a user's re-enable is respected."""
+        if disabled == (unique_id in self._data["disabled"]):
+            return
+        if disabled:
+            self._data["disabled"].append(unique_id)
+        else:
+            self._data["disabled"].remove(unique_id)
+        self._store.async_delay_save(lambda: self._data, 60)
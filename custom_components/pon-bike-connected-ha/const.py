@@ -10,3 +10,16 @@ DEFAULT_SCAN_INTERVAL = 300
 
 PLATFORMS: list[str] = ["sensor", "device_tracker"]
 
+# Fleet snapshot HTTP view (GeoJSON, ETag / 304)
+SNAPSHOT_URL = f"/api/{DOMAIN}/snapshot"
+DATA_SNAPSHOT_VIEW = f"{DOMAIN}_snapshot_view"
+
+# Historical backfill (rides + telemetry into long-term statistics)
+BACKFILL_MAX_CONCURRENCY = 2
+BACKFILL_STORAGE_VERSION = 1
+BACKFILL_INTERVAL = 3600  # seconds between incremental backfill runs
+
+# Capability detection per bike / driveUnitType
+CAPABILITIES_STORAGE_VERSION = 1
+CAPABILITIES_MIN_SAMPLES = 3
+CAPABILITIES_CONSTANT_AFTER = 14  # days without any change
@@ -1,23 +1,35 @@
 from __future__ import annotations
 
+import itertools
 import logging
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import PonBikeApi
+from .capabilities import PonBikeCapabilities
 from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Process-wide, so a reloaded entry never reuses a generation of its predecessor
+_GENERATIONS = itertools.count(1)
+
 
 class PonBikeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Poll bikes/info + last-known-states and merge into one data structure."""
 
-    def __init__(self, hass: HomeAssistant, api: PonBikeApi) -> None:
+    def __init__(
+        self, hass: HomeAssistant, api: PonBikeApi, capabilities: PonBikeCapabilities
+    ) -> None:
         self.api = api
+        self.capabilities = capabilities
+        # New value on every successful refresh; lets consumers cache derived data
+        self.generation = 0
+        self.last_refresh: str | None = None
         super().__init__(
             hass,
             _LOGGER,
@@ -40,10 +52,20 @@ class PonBikeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     if bid:
                         states_by_bike_id[str(bid)] = s
 
-            return {
+            data = {
                 "bikes": bikes_list,
                 "states_by_bike_id": states_by_bike_id,
             }
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(str(err)) from err
 
+        # Only learn from bikes that actually returned a state this cycle
+        for bike in bikes_list:
+            state = states_by_bike_id.get(str(bike.get("bikeId") or ""))
+            if state:
+                self.capabilities.observe(bike, state)
+
+        self.generation = next(_GENERATIONS)
+        self.last_refresh = dt_util.utcnow().isoformat()
+        return data
+
@@ -10,67 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import PonBikeCoordinator
-
-
-def _bike_name(bike: dict[str, Any]) -> str:
-    nickname = bike.get("nickName") or bike.get("nickname")
-    frame = bike.get("frameNumber")
-    bike_id = bike.get("bikeId")
-
-    if nickname and frame:
-        return f"{nickname} ({frame})"
-    if nickname:
-        return nickname
-    if frame:
-        return frame
-    if bike_id:
-        return bike_id
-    return "Bike"
-
-def _device_info(bike: dict[str, Any]) -> dict[str, Any]:
-    bike_id = str(bike.get("bikeId") or "")
-    manufacturer_id = bike.get("manufacturerId")
-
-    manufacturer = "PON"
-    if manufacturer_id == "UA":
-        manufacturer = "Urban Arrow"
-
-    # Show human-friendly model in the device card
-    model = bike.get("displayName") or bike.get("sku") or "Connected Bike"
-    serial = bike.get("frameNumber") or None
-
-    # Concatenate hardware attributes into hw_version
-    hw_parts = [
-        bike.get("category"),
-        bike.get("type"),
-        bike.get("color"),
-        bike.get("driveUnitType"),
-    ]
-    hw_parts = [str(p) for p in hw_parts if p]
-    hw_version = "-".join(hw_parts) if hw_parts else None
-
-    info: dict[str, Any] = {
-        "identifiers": {(DOMAIN, bike_id)},
-        "name": _bike_name(bike),
-        "manufacturer": manufacturer,
-        "model": model,
-        "serial_number": serial,
-    }
-
-    if hw_version:
-        info["hw_version"] = hw_version
-
-    return info
-
-def _extract_lat_lon(state: dict[str, Any]) -> tuple[float | None, float | None]:
-    loc = state.get("location") or {}
-    coord = (loc.get("coordinate") or {}) if isinstance(loc, dict) else {}
-    lat = coord.get("latitude")
-    lon = coord.get("longitude")
-    try:
-        return (float(lat), float(lon))
-    except (TypeError, ValueError):
-        return (None, None)
+from .helpers import bike_name, device_info, extract_lat_lon
 
 
 async def async_setup_entry(
@@ -101,8 +41,8 @@ class PonBikeTracker(CoordinatorEntity[PonBikeCoordinator], TrackerEntity):
         self._entry = entry
         self._bike = bike
         self._bike_id = str(bike.get("bikeId") or "")
-        self._bike_name = _bike_name(bike)
-        self._attr_device_info = _device_info(bike)
+        self._bike_name = bike_name(bike)
+        self._attr_device_info = device_info(bike)
 
         self._attr_name = f"{self._bike_name} Location"
         self._attr_unique_id = f"{entry.entry_id}_{self._bike_id}_tracker"
@@ -115,23 +55,26 @@ class PonBikeTracker(CoordinatorEntity[PonBikeCoordinator], TrackerEntity):
 
     @property
     def latitude(self) -> float | None:
-        lat, _ = _extract_lat_lon(self._state)
+        lat, _ = extract_lat_lon(self._state)
         return lat
 
     @property
     def longitude(self) -> float | None:
-        _, lon = _extract_lat_lon(self._state)
+        _, lon = extract_lat_lon(self._state)
         return lon
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         s = self._state
-        bt = s.get("bikeTelemetry") or {}
-        it = s.get("iotTelemetry") or {}
-        return {
+        attrs: dict[str, Any] = {
             "bikeId": self._bike_id,
             "lastOnline": s.get("lastOnline"),
-            "odometer_km": bt.get("odometer"),
-            "module_charge_pct": it.get("moduleCharge"),
         }
+        # Re-checked on every write; absent/constant fields are not extracted
+        caps = self.coordinator.capabilities
+        if caps.useful(self._bike, "odometer"):
+            attrs["odometer_km"] = (s.get("bikeTelemetry") or {}).get("odometer")
+        if caps.useful(self._bike, "module_charge"):
+            attrs["module_charge_pct"] = (s.get("iotTelemetry") or {}).get("moduleCharge")
+        return attrs
 
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .const import DOMAIN
+
+
+def bike_name(bike: dict[str, Any]) -> str:
+    nickname = bike.get("nickName") or bike.get("nickname")
+    frame = bike.get("frameNumber")
+    bike_id = bike.get("bikeId")
+
+    if nickname and frame:
+        return f"{nickname} ({frame})"
+    if nickname:
+        return nickname
+    if frame:
+        return frame
+    if bike_id:
+        return bike_id
+    return "Bike"
+
+def device_info(bike: dict[str, Any]) -> dict[str, Any]:
+    bike_id = str(bike.get("bikeId") or "")
+    manufacturer_id = bike.get("manufacturerId")
+
+    manufacturer = "PON"
+    if manufacturer_id == "UA":
+        manufacturer = "Urban Arrow"
+
+    # Show human-friendly model in the device card
+    model = bike.get("displayName") or bike.get("sku") or "Connected Bike"
+    serial = bike.get("frameNumber") or None
+
+    # Concatenate hardware attributes into hw_version
+    hw_parts = [
+        bike.get("category"),
+        bike.get("type"),
+        bike.get("color"),
+        bike.get("driveUnitType"),
+    ]
+    hw_parts = [str(p) for p in hw_parts if p]
+    hw_version = "-".join(hw_parts) if hw_parts else None
+
+    info: dict[str, Any] = {
+        "identifiers": {(DOMAIN, bike_id)},
+        "name": bike_name(bike),
+        "manufacturer": manufacturer,
+        "model": model,
+        "serial_number": serial,
+    }
+
+    if hw_version:
+        info["hw_version"] = hw_version
+
+    return info
+
+def extract_lat_lon(state: dict[str, Any]) -> tuple[float | None, float | None]:
+    loc = state.get("location") or {}
+    coord = (loc.get("coordinate") or {}) if isinstance(loc, dict) else {}
+    lat = coord.get("latitude")
+    lon = coord.get("longitude")
+    try:
+        return (float(lat), float(lon))
+    except (TypeError, ValueError):
+        return (None, None)
@@ -4,95 +4,116 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .capabilities import FIELDS
 from .const import DOMAIN
 from .coordinator import PonBikeCoordinator
+from .helpers import bike_name, device_info
 
 
-def _bike_name(bike: dict[str, Any]) -> str:
-    nickname = bike.get("nickName") or bike.get("nickname")
-    frame = bike.get("frameNumber")
-    bike_id = bike.get("bikeId")
-
-    if nickname and frame:
-        return f"{nickname} ({frame})"
-    if nickname:
-        return nickname
-    if frame:
-        return frame
-    if bike_id:
-        return bike_id
-    return "Bike"
-
-def _device_info(bike: dict[str, Any]) -> dict[str, Any]:
-    bike_id = str(bike.get("bikeId") or "")
-    manufacturer_id = bike.get("manufacturerId")
-
-    manufacturer = "PON"
-    if manufacturer_id == "UA":
-        manufacturer = "Urban Arrow"
-
-    # Show human-friendly model in the device card
-    model = bike.get("displayName") or bike.get("sku") or "Connected Bike"
-    serial = bike.get("frameNumber") or None
-
-    # Concatenate hardware attributes into hw_version
-    hw_parts = [
-        bike.get("category"),
-        bike.get("type"),
-        bike.get("color"),
-        bike.get("driveUnitType"),
-    ]
-    hw_parts = [str(p) for p in hw_parts if p]
-    hw_version = "-".join(hw_parts) if hw_parts else None
-
-    info: dict[str, Any] = {
-        "identifiers": {(DOMAIN, bike_id)},
-        "name": _bike_name(bike),
-        "manufacturer": manufacturer,
-        "model": model,
-        "serial_number": serial,
-    }
-
-    if hw_version:
-        info["hw_version"] = hw_version
-
-    return info
-
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
+@callback
+def _async_sync_registry(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: PonBikeCoordinator, bikes: list[dict[str, Any]]
 ) -> None:
-    coordinator: PonBikeCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    """Disable registered sensors for absent/constant fields; re-enable them if that changes.
 
-    entities: list[SensorEntity] = []
-    data = coordinator.data or {}
-    bikes: list[dict[str, Any]] = data.get("bikes", [])
-    states_by_id: dict[str, dict[str, Any]] = data.get("states_by_bike_id", {})
+    Only entities disabled by this integration are re-enabled, and an entity the
+    user re-enabled after we disabled it is left alone.
+    """
+    ent_reg = er.async_get(hass)
+    caps = coordinator.capabilities
 
     for bike in bikes:
         bike_id = str(bike.get("bikeId") or "")
         if not bike_id:
             continue
-        entities.append(PonBikeOdometerSensor(coordinator, entry, bike))
-        entities.append(PonBikeModuleChargeSensor(coordinator, entry, bike))
-        # (Optional later: add lastOnline timestamp sensor, etc.)
+        for field in FIELDS:
+            unique_id = f"{entry.entry_id}_{bike_id}_{field}"
+            entity_id = ent_reg.async_get_entity_id("sensor", DOMAIN, unique_id)
+            if entity_id is None or (reg_entry := ent_reg.async_get(entity_id)) is None:
+                continue
+
+            useful = caps.useful(bike, field)
+            ours = reg_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+            if not useful and ours:
+                # Also covers sensors registered disabled via enabled_default=False
+                caps.set_disabled(unique_id, True)
+            elif not useful and reg_entry.disabled_by is None and not caps.was_disabled(unique_id):
+                ent_reg.async_update_entity(entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION)
+                caps.set_disabled(unique_id, True)
+            elif useful and ours:
+                ent_reg.async_update_entity(entity_id, disabled_by=None)
+                caps.set_disabled(unique_id, False)
+            elif useful and caps.was_disabled(unique_id):
+                caps.set_disabled(unique_id, False)
+
 
-    async_add_entities(entities)
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: PonBikeCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    caps = coordinator.capabilities
+    added: set[str] = set()
+
+    @callback
+    def _async_add_sensors() -> None:
+        """Add sensors for fields that are provided and not added yet."""
+        entities: list[SensorEntity] = []
+        bikes: list[dict[str, Any]] = (coordinator.data or {}).get("bikes", [])
+
+        # Existing entries are disabled in the registry (so they stop writing state)
+        # before adding entities
+        _async_sync_registry(hass, entry, coordinator, bikes)
+
+        for bike in bikes:
+            bike_id = str(bike.get("bikeId") or "")
+            if not bike_id:
+                continue
+            # Skip fields this bike / drive unit never reports; new constant ones start disabled
+            for field, sensor_cls in (
+                ("odometer", PonBikeOdometerSensor),
+                ("module_charge", PonBikeModuleChargeSensor),
+            ):
+                unique_id = f"{entry.entry_id}_{bike_id}_{field}"
+                if unique_id in added or not caps.provides(bike, field):
+                    continue
+                added.add(unique_id)
+                if caps.is_constant(bike, field):
+                    caps.set_disabled(unique_id, True)
+                    entities.append(sensor_cls(coordinator, entry, bike, enabled_default=False))
+                else:
+                    entities.append(sensor_cls(coordinator, entry, bike))
+            # (Optional later: add lastOnline timestamp sensor, etc.)
+
+        if entities:
+            async_add_entities(entities)
+
+    # Re-checked after every refresh, so a field that starts reporting gets its sensor
+    _async_add_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_sensors))
 
 
 class _PonBikeBaseSensor(CoordinatorEntity[PonBikeCoordinator], SensorEntity):
-    def __init__(self, coordinator: PonBikeCoordinator, entry: ConfigEntry, bike: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        coordinator: PonBikeCoordinator,
+        entry: ConfigEntry,
+        bike: dict[str, Any],
+        enabled_default: bool = True,
+    ) -> None:
         super().__init__(coordinator)
+        self._attr_entity_registry_enabled_default = enabled_default
         self._entry = entry
         self._bike = bike
         self._bike_id = str(bike.get("bikeId") or "")
-        self._bike_name = _bike_name(bike)
-        self._attr_device_info = _device_info(bike)
+        self._bike_name = bike_name(bike)
+        self._attr_device_info = device_info(bike)
 
     @property
     def _state(self) -> dict[str, Any]:
@@ -103,8 +124,14 @@ class _PonBikeBaseSensor(CoordinatorEntity[PonBikeCoordinator], SensorEntity):
 class PonBikeOdometerSensor(_PonBikeBaseSensor):
     _attr_icon = "mdi:counter"
 
-    def __init__(self, coordinator: PonBikeCoordinator, entry: ConfigEntry, bike: dict[str, Any]) -> None:
-        super().__init__(coordinator, entry, bike)
+    def __init__(
+        self,
+        coordinator: PonBikeCoordinator,
+        entry: ConfigEntry,
+        bike: dict[str, Any],
+        enabled_default: bool = True,
+    ) -> None:
+        super().__init__(coordinator, entry, bike, enabled_default)
         self._attr_name = f"{self._bike_name} Odometer"
         self._attr_unique_id = f"{entry.entry_id}_{self._bike_id}_odometer"
         self._suggested_object_id = f"ponbike_{entry.entry_id}_{self._bike_id}_odometer"
@@ -124,8 +151,14 @@ class PonBikeOdometerSensor(_PonBikeBaseSensor):
 class PonBikeModuleChargeSensor(_PonBikeBaseSensor):
     _attr_icon = "mdi:battery"
 
-    def __init__(self, coordinator: PonBikeCoordinator, entry: ConfigEntry, bike: dict[str, Any]) -> None:
-        super().__init__(coordinator, entry, bike)
+    def __init__(
+        self,
+        coordinator: PonBikeCoordinator,
+        entry: ConfigEntry,
+        bike: dict[str, Any],
+        enabled_default: bool = True,
+    ) -> None:
+        super().__init__(coordinator, entry, bike, enabled_default)
         self._attr_name = f"{self._bike_name} Module charge"
         self._attr_unique_id = f"{entry.entry_id}_{self._bike_id}_module_charge"
         self._suggested_object_id = f"ponbike_{entry.entry_id}_{self._bike_id}_module_charge"
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, SNAPSHOT_URL
+from .helpers import bike_name, extract_lat_lon
+
+
+def _bike_feature(entry_id: str, bike: dict[str, Any], state: dict[str, Any]) -> dict[str, Any]:
+    bike_id = str(bike.get("bikeId") or "")
+    lat, lon = extract_lat_lon(state)
+    bt = state.get("bikeTelemetry") or {}
+    it = state.get("iotTelemetry") or {}
+
+    geometry: dict[str, Any] | None = None
+    if lat is not None and lon is not None:
+        # GeoJSON positions are [longitude, latitude]
+        geometry = {"type": "Point", "coordinates": [lon, lat]}
+
+    return {
+        "type": "Feature",
+        "id": bike_id,
+        "geometry": geometry,
+        "properties": {
+            "entryId": entry_id,
+            "bikeId": bike_id,
+            "name": bike_name(bike),
+            "driveUnitType": bike.get("driveUnitType"),
+            "lastOnline": state.get("lastOnline"),
+            "odometer_km": bt.get("odometer"),
+            "module_charge_pct": it.get("moduleCharge"),
+        },
+    }
+
+
+def build_snapshot(hass: HomeAssistant) -> dict[str, Any]:
+    """Build a GeoJSON FeatureCollection for all bikes of all loaded entries."""
+    features: list[dict[str, Any]] = []
+    coordinators: list[dict[str, Any]] = []
+
+    for entry_id, entry_data in sorted(hass.data.get(DOMAIN, {}).items()):
+        coordinator = entry_data.get("coordinator")
+        if coordinator is None:
+            continue
+        data = coordinator.data or {}
+        states_by_id: dict[str, dict[str, Any]] = data.get("states_by_bike_id", {})
+
+        coordinators.append(
+            {
+                "entryId": entry_id,
+                "generation": coordinator.generation,
+                "lastRefresh": coordinator.last_refresh,
+                "lastUpdateSuccess": coordinator.last_update_success,
+            }
+        )
+        for bike in data.get("bikes", []):
+            bike_id = str(bike.get("bikeId") or "")
+            if not bike_id:
+                continue
+            features.append(_bike_feature(entry_id, bike, states_by_id.get(bike_id, {})))
+
+    return {
+        "type": "FeatureCollection",
+        "features": features,
+        "coordinators": coordinators,
+    }
+
+
+def _generation_key(hass: HomeAssistant) -> tuple[tuple[str, int, bool], ...]:
+    return tuple(
+        (entry_id, entry_data["coordinator"].generation, entry_data["coordinator"].last_update_success)
+        for entry_id, entry_data in sorted(hass.data.get(DOMAIN, {}).items())
+        if entry_data.get("coordinator") is not None
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110 13.1.2)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class PonBikeSnapshotView(HomeAssistantView):
+    """Serve the current fleet snapshot as one conditional GET."""
+
+    url = SNAPSHOT_URL
+    name = f"api:{DOMAIN}:snapshot"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        # Serialised body + ETag, rebuilt only when a coordinator refreshes
+        self._cache_key: tuple[tuple[str, int, bool], ...] | None = None
+        self._cache_body: bytes = b""
+        self._cache_etag: str = ""
+
+    def _get_cached(self) -> tuple[bytes, str]:
+        key = _generation_key(self._hass)
+        if key != self._cache_key:
+            body = json.dumps(
+                build_snapshot(self._hass), separators=(",", ":"), sort_keys=True
+            ).encode()
+            self._cache_body = body
+            self._cache_etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            self._cache_key = key
+        return self._cache_body, self._cache_etag
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the snapshot, or 304 when the client copy is current."""
+        body, etag = self._get_cached()
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(body=body, content_type="application/geo+json", headers=headers)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+COMPONENT_DIR = Path(__file__).parent.parent / "custom_components" / "pon-bike-connected-ha"
+
+
+def load_module(name: str) -> ModuleType:
+    """Import a Home Assistant-free module of the integration by file name."""
+    module_name = f"pon_bike_{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, COMPONENT_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
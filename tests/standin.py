@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+from aiohttp import ClientSession, web
+
+# Query strings of every request received, for asserting on pagination
+REQUESTS = web.AppKey("requests", list)
+
+
+def make_app(
+    rides: list[dict[str, Any]], page_size: int = 2, expired_cursors: set[str] | None = None
+) -> web.Application:
+    """Local stand-in for the Data Act rides endpoint ({items, nextCursor}, cursor = offset)."""
+    expired = expired_cursors or set()
+    app = web.Application()
+    app[REQUESTS] = []
+
+    async def handle_rides(request: web.Request) -> web.Response:
+        app[REQUESTS].append(dict(request.query))
+        cursor = request.query.get("cursor")
+        if cursor in expired:
+            return web.Response(status=400, text="cursor expired")
+        since = request.query.get("from")
+
+        items = sorted(rides, key=lambda r: r["startTime"])
+        if since and cursor is None:
+            items = [r for r in items if r["startTime"] >= since]
+        offset = int(cursor) if cursor else 0
+        page = items[offset : offset + page_size]
+        next_cursor = str(offset + page_size) if offset + page_size < len(items) else None
+        return web.json_response({"items": page, "nextCursor": next_cursor})
+
+    app.router.add_get("/api/v1/bikes/{bike_id}/rides", handle_rides)
+    return app
+
+
+class StandInSession:
+    """Quacks like OAuth2Session.async_request, without any token handling."""
+
+    def __init__(self, session: ClientSession) -> None:
+        self._session = session
+
+    async def async_request(self, method: str, url: str, **kwargs: Any):
+        return await self._session.request(method, url, **kwargs)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp.test_utils import TestServer
+
+from conftest import load_module
+from standin import REQUESTS, StandInSession, make_app
+
+api_mod = load_module("api")
+
+RIDES = [
+    {"id": f"r{i}", "startTime": f"2026-10-0{i}T08:15:00+00:00", "distance": float(i)}
+    for i in range(1, 6)
+]
+
+
+async def _collect(app, **kwargs):
+    async with TestServer(app) as server, ClientSession() as session:
+        api = api_mod.PonBikeApi(StandInSession(session), base_url=str(server.make_url("/api")))
+        return [page async for page in api.async_iter_rides("bike1", **kwargs)]
+
+
+def test_iter_rides_follows_cursor_until_exhausted() -> None:
+    app = make_app(RIDES, page_size=2)
+    pages = asyncio.run(_collect(app))
+
+    assert [[r["id"] for r in items] for items, _ in pages] == [["r1", "r2"], ["r3", "r4"], ["r5"]]
+    assert [cursor for _, cursor in pages] == ["2", "4", None]
+    assert [q.get("cursor") for q in app[REQUESTS]] == [None, "2", "4"]
+    assert all(q["order"] == "asc" for q in app[REQUESTS])
+
+
+def test_iter_rides_uses_since_without_cursor() -> None:
+    app = make_app(RIDES, page_size=10)
+    pages = asyncio.run(_collect(app, since="2026-10-04T00:00:00+00:00"))
+
+    assert [r["id"] for r in pages[0][0]] == ["r4", "r5"]
+    assert app[REQUESTS][0]["from"] == "2026-10-04T00:00:00+00:00"
+
+
+def test_rejected_cursor_raises_api_error() -> None:
+    app = make_app(RIDES, expired_cursors={"2"})
+    with pytest.raises(api_mod.PonBikeApiError, match="HTTP 400"):
+        asyncio.run(_collect(app, cursor="2"))
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from conftest import load_module
+
+history = load_module("history")
+
+
+def _ride(ride_id: str, start: str, distance: float) -> dict:
+    return {"id": ride_id, "startTime": start, "distance": distance}
+
+
+def test_accumulate_sums_per_hour() -> None:
+    checkpoint = history.new_checkpoint()
+    rows = history.accumulate(
+        checkpoint,
+        [
+            _ride("a", "2026-10-01T08:05:00Z", 2.0),
+            _ride("b", "2026-10-01T08:40:00Z", 3.0),
+            _ride("c", "2026-10-01T09:10:00Z", 4.0),
+        ],
+        history.ride_entry,
+    )
+
+    assert [(r["start"].hour, r["state"], r["sum"]) for r in rows["ride_distance"]] == [
+        (8, 5.0, 5.0),
+        (9, 4.0, 9.0),
+    ]
+
+
+def test_accumulate_resume_does_not_double_count() -> None:
+    page1 = [_ride("a", "2026-10-01T08:05:00Z", 2.0), _ride("b", "2026-10-01T08:40:00Z", 3.0)]
+    page2 = [_ride("c", "2026-10-01T08:50:00Z", 1.0)]
+
+    checkpoint = history.new_checkpoint()
+    history.accumulate(checkpoint, page1, history.ride_entry)
+    # Interrupted before the cursor advanced: page 1 is served again, then page 2
+    assert history.accumulate(checkpoint, page1, history.ride_entry) == {}
+    rows = history.accumulate(checkpoint, page2, history.ride_entry)
+
+    assert rows["ride_distance"][-1]["state"] == 6.0
+    assert rows["ride_distance"][-1]["sum"] == 6.0
+
+
+def test_accumulate_keeps_rides_sharing_a_start_time() -> None:
+    checkpoint = history.new_checkpoint()
+    history.accumulate(checkpoint, [_ride("a", "2026-10-01T08:00:00Z", 1.0)], history.ride_entry)
+    # Same start time across a page boundary, one already counted and one new
+    rows = history.accumulate(
+        checkpoint,
+        [_ride("a", "2026-10-01T08:00:00Z", 1.0), _ride("b", "2026-10-01T08:00:00Z", 2.0)],
+        history.ride_entry,
+    )
+
+    assert rows["ride_distance"][-1]["sum"] == 3.0
+    assert checkpoint["last_ids"] == ["a", "b"]
+
+
+def test_accumulate_sorts_newest_first_page() -> None:
+    checkpoint = history.new_checkpoint()
+    rows = history.accumulate(
+        checkpoint,
+        [_ride("b", "2026-10-01T09:00:00Z", 2.0), _ride("a", "2026-10-01T08:00:00Z", 1.0)],
+        history.ride_entry,
+    )
+
+    assert [r["sum"] for r in rows["ride_distance"]] == [1.0, 3.0]
+
+
+def test_accumulate_skips_filtered_keys() -> None:
+    checkpoint = history.new_checkpoint()
+    state = {
+        "timestamp": "2026-10-01T08:00:00Z",
+        "bikeTelemetry": {"odometer": 120.5},
+        "iotTelemetry": {"moduleCharge": 100},
+    }
+    rows = history.accumulate(checkpoint, [state], history.state_entry, ["odometer"])
+
+    assert list(rows) == ["odometer"]
+    assert rows["odometer"][0]["mean"] == 120.5